@@ -2,10 +2,31 @@
 """
 Generate Lua C function bridge implementations for all remaining API bridges.
 This script creates standardized bridge files for the zig_llms Lua integration.
+
+The checked-in bridge files under src/scripting/engines/lua_bridges/ started
+as output of this script but have since been hand-edited; rerunning the
+generator overwrites those edits. Its cache and manifest files are therefore
+local scratch state, not part of the repository.
 """
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import Dict, List, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from string import Template
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Output directory for the generated bridge files, relative to this script
+BASE_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "src", "scripting", "engines", "lua_bridges",
+))
 
 # Bridge configurations: name -> (functions, constants, imports)
 BRIDGE_CONFIGS = {
@@ -137,30 +158,71 @@ BRIDGE_CONFIGS = {
     },
 }
 
-def generate_bridge_file(bridge_name: str, config: Dict) -> str:
-    """Generate a complete Lua bridge file for the given bridge configuration."""
-    
-    functions = config["functions"]
-    constants = config.get("constants", [])
-    import_name = config["import_name"]
-    description = config["description"]
-    
-    # Generate function definitions
-    function_defs = []
-    function_impls = []
-    
-    for i, (func_name, func_doc) in enumerate(functions):
-        lua_func_name = f"lua{bridge_name.title()}{func_name.title().replace('_', '')}"
-        function_defs.append(f'        .{{ .name = "{func_name}", .func = {lua_func_name} }},')
-        
-        # Generate function implementation
-        func_impl = f'''
+def _cap(s: str) -> str:
+    """Uppercase the first character of a known-ASCII identifier segment.
+
+    Unlike str.title(), this never consults the Unicode category tables.
+    """
+    return s[:1].upper() + s[1:]
+
+class _FrozenCfg(NamedTuple):
+    """Immutable bridge config with the render-time derived strings attached.
+
+    NamedTuple keeps attribute access on the C tuple fast path and makes the
+    whole config hashable, so it can serve directly as an lru_cache key.
+    """
+    functions: Tuple[Tuple[str, str, str, str], ...]
+    constants: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]
+    import_name: str
+    description: str
+    bridge_title: str
+    function_count: int
+
+def _freeze(configs: Dict) -> "MappingProxyType[str, _FrozenCfg]":
+    """Freeze the raw configs into immutable, precomputed form.
+
+    Everything derived here is a pure function of the static config, so
+    computing it once at import time keeps the render loops free of repeated
+    capitalization/lower()/replace() calls, and the frozen tuples avoid
+    per-access dict traversal and fresh iterators downstream.
+    """
+    frozen = {}
+    for bridge_name, config in configs.items():
+        bridge_title = _cap(bridge_name)
+        functions = tuple(
+            (
+                func_name,
+                func_doc,
+                ''.join(('lua', bridge_title, *map(_cap, func_name.split('_')))),
+                func_name.replace("_", ""),
+            )
+            for func_name, func_doc in config["functions"]
+        )
+        frozen[bridge_name] = _FrozenCfg(
+            functions=functions,
+            constants=tuple(
+                (const_name, tuple((value, value.lower()) for value in values))
+                for const_name, values in config.get("constants", [])
+            ),
+            import_name=config["import_name"],
+            description=config["description"],
+            bridge_title=bridge_title,
+            function_count=len(functions),
+        )
+    return MappingProxyType(frozen)
+
+BRIDGE_CONFIGS = _freeze(BRIDGE_CONFIGS)
+
+# Templates are prepared once at module load and rendered per bridge/function.
+# The per-function template is a plain str rendered with a single format_map
+# call (no regex scan as in string.Template, no per-call f-string bytecode);
+# literal Zig braces are doubled to escape them.
+_FUNC_IMPL_TMPL = '''
 /// {func_doc}
 export fn {lua_func_name}(L: ?*lua.c.lua_State) c_int {{
-    const context = LuaAPIBridge.getScriptContext(L) orelse {{
-        return LuaAPIBridge.handleBridgeError(L, LuaAPIBridge.LuaAPIBridgeError.ScriptContextRequired);
-    }};
-    
+    const context = LuaAPIBridge.getScriptContext(L) orelse
+        return _bail(L, LuaAPIBridge.LuaAPIBridgeError.ScriptContextRequired);
+
     // Convert arguments from Lua to ScriptValue
     const arg_count = lua.c.lua_gettop(L);
     var args = std.ArrayList(ScriptValue).init(context.allocator);
@@ -170,49 +232,27 @@ export fn {lua_func_name}(L: ?*lua.c.lua_State) c_int {{
         }}
         args.deinit();
     }};
-    
+
     for (0..@intCast(arg_count)) |i| {{
-        const arg_value = LuaValueConverter.pullScriptValue(context.allocator, L, @intCast(i + 1)) catch |err| {{
-            return LuaAPIBridge.handleBridgeError(L, err);
-        }};
+        const arg_value = LuaValueConverter.pullScriptValue(context.allocator, L, @intCast(i + 1)) catch |err| return _bail(L, err);
         try args.append(arg_value);
     }}
-    
+
     // Call the bridge function
-    const result = {bridge_name.title()}Bridge.{func_name.replace('_', '')}(context, args.items) catch |err| {{
-        return LuaAPIBridge.handleBridgeError(L, err);
-    }};
+    const result = {bridge_title}Bridge.{call_name}(context, args.items) catch |err| return _bail(L, err);
     defer result.deinit(context.allocator);
-    
+
     // Convert result back to Lua
-    LuaValueConverter.pushScriptValue(context.allocator, L, result) catch |err| {{
-        return LuaAPIBridge.handleBridgeError(L, err);
-    }};
-    
+    LuaValueConverter.pushScriptValue(context.allocator, L, result) catch |err| return _bail(L, err);
+
     return 1;
 }}'''
-        function_impls.append(func_impl)
-    
-    # Generate constants
-    constants_code = []
-    for const_name, const_values in constants:
-        const_block = f'''
-    // {const_name} constants
-    lua.c.lua_newtable(L);
-    '''
-        for value in const_values:
-            const_block += f'''
-    lua.c.lua_pushstring(L, "{value.lower()}");
-    lua.c.lua_setfield(L, -2, "{value}");'''
-        
-        const_block += f'''
-    
-    lua.c.lua_setfield(L, -2, "{const_name}");'''
-        constants_code.append(const_block)
-    
-    # Generate the complete file
-    file_content = f'''// ABOUTME: Lua C function wrappers for {bridge_name.title()} Bridge API
-// ABOUTME: Provides Lua access to {description}
+
+# The file skeleton is split around the variable-length sections
+# (function defs, constants, implementations) so the final file can be
+# assembled as one flat list of parts and joined exactly once
+_FILE_HEADER_TMPL = Template('''// ABOUTME: Lua C function wrappers for ${bridge_title} Bridge API
+// ABOUTME: Provides Lua access to ${description}
 
 const std = @import("std");
 const lua = @import("../../../bindings/lua/lua.zig");
@@ -222,65 +262,396 @@ const ScriptContext = @import("../../context.zig").ScriptContext;
 const LuaValueConverter = @import("../lua_value_converter.zig");
 const LuaAPIBridge = @import("../lua_api_bridge.zig");
 
-// Import the actual {bridge_name} bridge implementation
-const {bridge_name.title()}Bridge = @import("../../api_bridges/{bridge_name}_bridge.zig").{bridge_name.title()}Bridge;
+// Import the actual ${bridge_name} bridge implementation
+const ${bridge_title}Bridge = @import("../../api_bridges/${bridge_name}_bridge.zig").${bridge_title}Bridge;
 
-// Import zig_llms {bridge_name} API
-const {import_name} = @import("../../../{import_name}.zig");
+// Import zig_llms ${bridge_name} API
+const ${import_name} = @import("../../../${import_name}.zig");
 
 /// Number of functions in this bridge
-pub const FUNCTION_COUNT = {len(functions)};
+pub const FUNCTION_COUNT = ${function_count};
 
-/// {bridge_name.title()} bridge errors specific to Lua integration
-pub const Lua{bridge_name.title()}Error = error{{
-    Invalid{bridge_name.title()},
-    {bridge_name.title()}NotFound,
+/// ${bridge_title} bridge errors specific to Lua integration
+pub const Lua${bridge_title}Error = error{
+    Invalid${bridge_title},
+    ${bridge_title}NotFound,
     InvalidDefinition,
     ExecutionFailed,
-}} || LuaAPIBridge.LuaAPIBridgeError;
+} || LuaAPIBridge.LuaAPIBridgeError;
 
-/// Register all {bridge_name} bridge functions with Lua
-pub fn register(wrapper: *LuaWrapper, context: *ScriptContext) LuaAPIBridge.LuaAPIBridgeError!void {{
+/// Shared error exit for the generated functions below
+inline fn _bail(L: ?*lua.c.lua_State, err: anytype) c_int {
+    return LuaAPIBridge.handleBridgeError(L, err);
+}
+
+/// Register all ${bridge_name} bridge functions with Lua
+pub fn register(wrapper: *LuaWrapper, context: *ScriptContext) LuaAPIBridge.LuaAPIBridgeError!void {
     LuaAPIBridge.setScriptContext(wrapper.state, context);
     LuaAPIBridge.presizeStack(wrapper, FUNCTION_COUNT + 5);
-    
-    const functions = [_]struct {{ name: []const u8, func: lua.c.lua_CFunction }} {{
-{chr(10).join(function_defs)}
-    }};
-    
-    for (functions) |func| {{
-        lua.c.lua_pushcfunction(wrapper.state, func.func);
-        lua.c.lua_setfield(wrapper.state, -2, func.name.ptr);
-    }}
-    
+
+    inline for (.{
+''')
+
+_FILE_MID_TMPL = Template('''
+    }) |entry| {
+        lua.c.lua_pushcfunction(wrapper.state, entry[1]);
+        lua.c.lua_setfield(wrapper.state, -2, entry[0].ptr);
+    }
+
     addConstants(wrapper.state);
-    std.log.debug("Registered {{}} {bridge_name} bridge functions", .{{functions.len}});
-}}
+    std.log.debug("Registered {} ${bridge_name} bridge functions", .{FUNCTION_COUNT});
+}
+
+pub fn cleanup() void {
+    std.log.debug("Cleaning up ${bridge_name} bridge resources");
+}
 
-pub fn cleanup() void {{
-    std.log.debug("Cleaning up {bridge_name} bridge resources");
-}}
+fn addConstants(L: ?*lua.c.lua_State) void {''')
 
-fn addConstants(L: ?*lua.c.lua_State) void {{{chr(10).join(constants_code)}
-}}
+_FILE_FOOTER = '''
+}
 
 // Lua C Function Implementations
-{chr(10).join(function_impls)}'''
-
-    return file_content
-
-def main():
-    """Generate all remaining Lua bridge files."""
-    base_dir = "/Users/spuri/projects/lexlapax/zig_llms/src/scripting/engines/lua_bridges"
-    
-    for bridge_name, config in BRIDGE_CONFIGS.items():
-        file_path = f"{base_dir}/{bridge_name}_bridge.zig"
-        content = generate_bridge_file(bridge_name, config)
-        
-        with open(file_path, 'w') as f:
-            f.write(content)
-        
-        print(f"Generated {file_path}")
+'''
+
+NL = '\n'
+
+# Constant-table emission: each group becomes a comptime inline for over
+# .{ "NAME", "value" } pairs built from the precomputed (VALUE, lowercase)
+# pairs, so Python emits one tuple line per value and Zig unrolls the rest
+_CONST_HEADER_TMPL = '''
+    // {0} constants
+    lua.c.lua_newtable(L);
+    inline for (.{{'''
+
+_CONST_PAIR_TMPL = '''
+        .{{ "{0}", "{1}" }},'''
+
+_CONST_FOOTER_TMPL = '''
+    }}) |kv| {{
+        lua.c.lua_pushstring(L, kv[1].ptr);
+        lua.c.lua_setfield(L, -2, kv[0].ptr);
+    }}
+    lua.c.lua_setfield(L, -2, "{0}");'''
+
+def _iter_sections(bridge_name: str, cfg: _FrozenCfg):
+    """Yield the rendered bridge file section by section, in file order.
+
+    Streaming sections lets callers write to disk without ever holding the
+    full file content as one string; generate_bridge_file joins them for
+    callers that do want the whole file.
+    """
+
+    functions = cfg.functions
+    constants = cfg.constants
+    import_name = cfg.import_name
+    description = cfg.description
+    bridge_title = cfg.bridge_title
+
+    # One pass over the functions fills both variable-length sections; the
+    # def and impl for a function land in different parts of the file, so
+    # they accumulate in separate StringIO buffers
+    defs_buf = StringIO()
+    impls_buf = StringIO()
+    write_def = defs_buf.write
+    write_impl = impls_buf.write
+
+    for i, (func_name, func_doc, lua_func_name, call_name) in enumerate(functions):
+        if i:
+            write_def(NL)
+            write_impl(NL)
+        write_def(f'        .{{ "{func_name}", {lua_func_name} }},')
+        write_impl(_FUNC_IMPL_TMPL.format_map({
+            'func_doc': func_doc,
+            'lua_func_name': lua_func_name,
+            'bridge_title': bridge_title,
+            'call_name': call_name,
+        }))
+
+    # Generate constants; each block is joined once from its parts, since
+    # accumulating with str += recopies the whole block every iteration
+    constants_code = []
+    for const_name, const_values in constants:
+        block_parts = [_CONST_HEADER_TMPL.format(const_name)]
+        block_parts.extend(
+            _CONST_PAIR_TMPL.format(value, lower_value)
+            for value, lower_value in const_values
+        )
+        block_parts.append(_CONST_FOOTER_TMPL.format(const_name))
+        constants_code.append(''.join(block_parts))
+
+    # Emit the file as a flat sequence of sections; newline separators are
+    # yielded as their own parts so no section is materialized as an
+    # intermediate joined string
+    yield _FILE_HEADER_TMPL.substitute(
+        bridge_name=bridge_name,
+        bridge_title=bridge_title,
+        description=description,
+        import_name=import_name,
+        function_count=cfg.function_count,
+    )
+
+    yield defs_buf.getvalue()
+
+    yield _FILE_MID_TMPL.substitute(bridge_name=bridge_name)
+
+    for i, const_block in enumerate(constants_code):
+        if i:
+            yield NL
+        yield const_block
+
+    yield _FILE_FOOTER
+
+    yield impls_buf.getvalue()
+
+@functools.lru_cache(maxsize=None)
+def generate_bridge_file(bridge_name: str, cfg: _FrozenCfg) -> bytes:
+    """Generate a complete Lua bridge file for the given bridge configuration.
+
+    The frozen config is hashable, so repeated renders of an unchanged bridge
+    within one process are served from the lru_cache. Returns the file
+    content as ASCII bytes.
+    """
+    return ''.join(_iter_sections(bridge_name, cfg)).encode('ascii')
+
+def write_bridge_file(file_path: str, bridge_name: str, cfg: _FrozenCfg,
+                      cache_path: Optional[str] = None) -> Tuple[str, str]:
+    """Stream one bridge to disk, replacing the file only when content differs.
+
+    Sections are written to a sibling .tmp file through a buffered writer and
+    hashed on the way through, so the full file content is never held in
+    memory. The real file is only touched (via os.replace) when the rendered
+    content differs from what is on disk. When cache_path is given, the
+    rendered bytes are teed into the result cache as well. Returns
+    ("Generated" or "Unchanged", sha256 of the rendered content).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            existing_hash = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        existing_hash = None
+
+    tmp_path = file_path + '.tmp'
+    cache_tmp = cache_path + '.tmp' if cache_path else None
+    hasher = hashlib.sha256()
+    with open(tmp_path, 'wb', buffering=1 << 16) as f:
+        cache_f = open(cache_tmp, 'wb', buffering=1 << 16) if cache_tmp else None
+        try:
+            for section in _iter_sections(bridge_name, cfg):
+                data = section.encode('ascii')
+                hasher.update(data)
+                f.write(data)
+                if cache_f:
+                    cache_f.write(data)
+        finally:
+            if cache_f:
+                cache_f.close()
+
+    if cache_tmp:
+        os.replace(cache_tmp, cache_path)
+
+    rendered_hash = hasher.hexdigest()
+    if rendered_hash == existing_hash:
+        os.unlink(tmp_path)
+        return "Unchanged", rendered_hash
+
+    os.replace(tmp_path, file_path)
+    return "Generated", rendered_hash
+
+# Maps bridge_name -> versioned hash (config + this script) of the last
+# generation, so unchanged bridges can skip rendering entirely on later runs
+CACHE_FILE = os.path.join(BASE_DIR, ".codegen-cache.json")
+
+# Maps bridge_name -> config and output hashes of the last generation;
+# --check verifies against this without rendering anything. Local-only,
+# like the codegen cache: the checked-in bridges are hand-maintained, so
+# a manifest is only meaningful on a machine that ran the generator
+MANIFEST_FILE = os.path.join(BASE_DIR, "manifest.json")
+
+# Per-user result cache of rendered bridge files, surviving process restarts.
+# TEMPLATE_VERSION folds this script's own content into the cache key so any
+# edit to the templates or config automatically invalidates stale entries.
+RESULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "zig_llms_bridges",
+)
+
+with open(os.path.abspath(__file__), 'rb') as _f:
+    TEMPLATE_VERSION = hashlib.sha256(_f.read()).hexdigest()
+
+def _config_hash(cfg: _FrozenCfg) -> str:
+    """Stable hash of a frozen bridge config, including the derived fields."""
+    return hashlib.sha256(json.dumps(cfg).encode()).hexdigest()
+
+def _bridge_hash(cfg: _FrozenCfg) -> str:
+    """Hash recorded per bridge: covers the config and this script's bytes.
+
+    Folding TEMPLATE_VERSION in means a template edit invalidates the
+    regeneration skip and the result cache alike, not just the latter.
+    """
+    return hashlib.sha256((_config_hash(cfg) + TEMPLATE_VERSION).encode()).hexdigest()
+
+def _result_cache_path(bridge_hash: str) -> str:
+    return os.path.join(RESULT_CACHE_DIR, f"{bridge_hash}.zig")
+
+def _load_cache() -> Dict[str, str]:
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _render_one(item: Tuple[str, _FrozenCfg, Optional[str], Optional[str]]) -> Tuple[str, str, str, str, str]:
+    """Generate and write a single bridge file unless it is already current.
+
+    Rewriting an identical file would invalidate its timestamp and force
+    zig build to recompile it, so the file is only touched when the
+    rendered content actually differs. The last tuple element is the sha256
+    of the content this run rendered or verified on disk.
+    """
+    bridge_name, cfg, cached_hash, expected_sha = item
+    file_path = os.path.join(BASE_DIR, f"{bridge_name}_bridge.zig")
+
+    bridge_hash = _bridge_hash(cfg)
+    if (cached_hash == bridge_hash and expected_sha is not None
+            and _file_sha256(file_path) == expected_sha):
+        return bridge_name, file_path, bridge_hash, "Up to date", expected_sha
+
+    # Serve the render from the persistent result cache when possible; a hit
+    # reduces an up-to-date bridge to a read_bytes plus compare
+    result_path = _result_cache_path(bridge_hash)
+    try:
+        with open(result_path, 'rb') as f:
+            cached_content = f.read()
+    except OSError:
+        cached_content = None
+
+    if cached_content is not None:
+        cached_sha = hashlib.sha256(cached_content).hexdigest()
+        try:
+            with open(file_path, 'rb') as f:
+                current = f.read()
+        except OSError:
+            current = None
+
+        if current == cached_content:
+            return bridge_name, file_path, bridge_hash, "Unchanged", cached_sha
+
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(cached_content)
+        os.replace(tmp_path, file_path)
+        return bridge_name, file_path, bridge_hash, "Cached", cached_sha
+
+    os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+    status, rendered_sha = write_bridge_file(file_path, bridge_name, cfg, cache_path=result_path)
+    return bridge_name, file_path, bridge_hash, status, rendered_sha
+
+def _file_sha256(file_path: str) -> Optional[str]:
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def check() -> int:
+    """Verify the generated files against the local manifest, rendering nothing.
+
+    Only meaningful after running the generator on the same machine, since
+    the manifest is not committed: each existing file is hashed and compared
+    to the manifest entry, and any missing, stale or config-drifted bridge
+    fails the check.
+    """
+    try:
+        with open(MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        print(f"{MANIFEST_FILE} missing or unreadable; run the generator first",
+              file=sys.stderr)
+        return 1
+
+    failures = 0
+    for bridge_name, cfg in BRIDGE_CONFIGS.items():
+        file_path = os.path.join(BASE_DIR, f"{bridge_name}_bridge.zig")
+        entry = manifest.get(bridge_name, {})
+        if (entry.get("config_sha256") != _bridge_hash(cfg)
+                or entry.get("output_sha256") != _file_sha256(file_path)):
+            print(f"Stale: {file_path}")
+            failures += 1
+        else:
+            print(f"OK: {file_path}")
+
+    return 1 if failures else 0
+
+async def _amain(jobs: List[Tuple[str, _FrozenCfg, Optional[str], Optional[str]]]) -> List[Tuple[str, str, str, str, str]]:
+    """Single-process mode: overlap rendering with file writes.
+
+    Each bridge's render-and-write runs in a worker thread, so the next
+    bridge renders while the previous one's bytes are being flushed to disk.
+    """
+    return await asyncio.gather(*[asyncio.to_thread(_render_one, job) for job in jobs])
+
+def main(argv: Optional[List[str]] = None):
+    """Generate all remaining Lua bridge files.
+
+    Each bridge is independent and CPU-bound on string rendering, so the
+    default mode spreads the bridges across worker processes; --async keeps
+    one process and overlaps rendering with file I/O instead.
+    """
+    parser = argparse.ArgumentParser(description="Generate Lua API bridge files.")
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="single-process mode overlapping rendering with file I/O",
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="verify generated files against the local manifest.json and exit "
+             "non-zero on mismatch (requires a prior generator run)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        sys.exit(check())
+
+    cache = _load_cache()
+    try:
+        with open(MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    # A bridge may only be skipped when the manifest vouches for the bytes
+    # currently on disk; a missing or config-drifted entry forces the worker
+    # down the verify-and-repair paths instead
+    jobs = []
+    for bridge_name, cfg in BRIDGE_CONFIGS.items():
+        prev = manifest.get(bridge_name, {})
+        expected_sha = (prev.get("output_sha256")
+                        if prev.get("config_sha256") == _bridge_hash(cfg) else None)
+        jobs.append((bridge_name, cfg, cache.get(bridge_name), expected_sha))
+
+    if args.use_async:
+        results = asyncio.run(_amain(jobs))
+    else:
+        max_workers = min(len(BRIDGE_CONFIGS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_render_one, jobs))
+
+    for bridge_name, file_path, bridge_hash, status, output_sha in results:
+        cache[bridge_name] = bridge_hash
+        print(f"{status}: {file_path}")
+        # Every result path rendered, restored or verified the file this run,
+        # so output_sha is always a real hash of the bytes now on disk
+        manifest[bridge_name] = {
+            "config_sha256": bridge_hash,
+            "output_sha256": output_sha,
+        }
+
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file